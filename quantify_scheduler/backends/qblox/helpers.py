@@ -30,11 +30,42 @@ from quantify_scheduler.helpers.importers import export_python_object_to_path_st
 from quantify_scheduler.helpers.schedule import (
     extract_acquisition_metadata_from_acquisition_protocols,
 )
-from quantify_scheduler.helpers.waveforms import exec_waveform_function
+from quantify_scheduler.helpers.waveforms import (
+    _is_whitelisted_waveform_function,
+    exec_waveform_function,
+)
+from quantify_scheduler.json_utils import lru_cache
 from quantify_scheduler.operations.pulse_library import WindowOperation
 from quantify_scheduler.schedules.schedule import AcquisitionMetadata
 
 
+def _get_sample_times(
+    num_samples: int, sampling_rate: float, wf_func: str
+) -> np.ndarray:
+    """
+    Return the sample times of a waveform, starting at 0.
+
+    Pulses of the same duration are common, so the time axis of the built-in
+    waveforms is cached and shared. Custom waveform functions may modify or return
+    ``t``, so they get their own array, as do waveforms that do not fit in the
+    waveform memory.
+    """
+    if (
+        num_samples <= constants.MAX_SAMPLE_SIZE_WAVEFORMS
+        and _is_whitelisted_waveform_function(wf_func)
+    ):
+        return _get_shared_sample_times(num_samples, sampling_rate)
+    return np.arange(start=0, stop=num_samples, step=1) / sampling_rate
+
+
+@lru_cache
+def _get_shared_sample_times(num_samples: int, sampling_rate: float) -> np.ndarray:
+    # Read-only, since the same array is shared between all callers.
+    t = np.arange(start=0, stop=num_samples, step=1) / sampling_rate
+    t.flags.writeable = False
+    return t
+
+
 def generate_waveform_data(
     data_dict: dict, sampling_rate: float, duration: Optional[float] = None
 ) -> np.ndarray:
@@ -73,7 +104,7 @@ def generate_waveform_data(
             ) from exc
 
     num_samples = round(duration * sampling_rate)
-    t = np.arange(start=0, stop=num_samples, step=1) / sampling_rate
+    t = _get_sample_times(num_samples, sampling_rate, data_dict["wf_func"])
 
     wf_data = exec_waveform_function(
         wf_func=data_dict["wf_func"], t=t, pulse_info=data_dict
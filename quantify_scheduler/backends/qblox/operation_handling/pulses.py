@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import logging
 from collections import namedtuple
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import math
@@ -16,11 +16,53 @@ from quantify_scheduler.backends.qblox import constants, helpers, q1asm_instruct
 from quantify_scheduler.backends.qblox.operation_handling.base import IOperationStrategy
 from quantify_scheduler.backends.qblox.qasm_program import QASMProgram
 from quantify_scheduler.backends.types import qblox as types
-from quantify_scheduler.helpers.waveforms import normalize_waveform_data
+from quantify_scheduler.helpers.waveforms import (
+    _is_whitelisted_waveform_function,
+    normalize_waveform_data,
+)
+from quantify_scheduler.json_utils import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _generate_normalized_waveform_data(
+    data: Dict[str, Any]
+) -> Tuple[np.ndarray, float, float]:
+    """
+    Generate the waveform described by ``data`` and normalize it.
+
+    The result is cached for the built-in waveform functions when all values in
+    ``data`` are hashable. The returned array is then shared between pulses with equal
+    data and is therefore read-only. Custom waveform functions are always evaluated,
+    as they can be redefined or depend on more than their arguments.
+    """
+    if not _is_whitelisted_waveform_function(data["wf_func"]):
+        return _normalize_waveform_data(data)
+    data_items = tuple(sorted(data.items()))
+    try:
+        hash(data_items)
+    except TypeError:
+        # The data contains unhashable values (e.g. sample arrays).
+        return _normalize_waveform_data(data)
+    return _generate_normalized_waveform_data_cached(data_items)
+
+
+@lru_cache
+def _generate_normalized_waveform_data_cached(
+    data_items: Tuple[Tuple[str, Any], ...]
+) -> Tuple[np.ndarray, float, float]:
+    return _normalize_waveform_data(dict(data_items))
+
+
+def _normalize_waveform_data(data: Dict[str, Any]) -> Tuple[np.ndarray, float, float]:
+    waveform_data = helpers.generate_waveform_data(
+        data, sampling_rate=constants.SAMPLING_RATE
+    )
+    waveform_data, amp_real, amp_imag = normalize_waveform_data(waveform_data)
+    waveform_data.flags.writeable = False
+    return waveform_data, amp_real, amp_imag
+
+
 class PulseStrategyPartial(IOperationStrategy):
     """Contains the logic shared between all the pulses."""
 
@@ -135,10 +177,9 @@ class GenericPulseStrategy(PulseStrategyPartial):
             to "complex".
         """  # pylint: disable=line-too-long
         op_info = self.operation_info
-        waveform_data = helpers.generate_waveform_data(
-            op_info.data, sampling_rate=constants.SAMPLING_RATE
+        waveform_data, amp_real, amp_imag = _generate_normalized_waveform_data(
+            op_info.data
         )
-        waveform_data, amp_real, amp_imag = normalize_waveform_data(waveform_data)
         self._waveform_len = len(waveform_data)
 
         if np.any(np.iscomplex(waveform_data)) and not self.io_mode == "complex":
@@ -102,7 +102,7 @@ class QASMProgram:
         SyntaxError
             More arguments passed than the sequencer allows.
         """
-        instr_args = ",".join(str(arg) for arg in args)
+        instr_args = ",".join(map(str, args))
 
         label_str = f"{label}:" if label is not None else ""
         comment_str = f"# {comment}" if comment is not None else ""
@@ -479,38 +479,40 @@ class SeqcILGenerator(object):
             str
                 The seqc program.
         """
-        program: str = ""
-        program += "// Generated by quantify-scheduler.\n"
-        program += "// Variables\n"
+        parts: List[str] = ["// Generated by quantify-scheduler.\n", "// Variables\n"]
         for name, operation in self._variables.values():
             if operation is not None:
-                program += f"{name} = {operation}\n"
+                parts.append(f"{name} = {operation}\n")
             else:
-                program += f"{name};\n"
+                parts.append(f"{name};\n")
 
         if len(self._program) == 0:
-            return program
+            return "".join(parts)
 
-        program += "\n// Operations\n"
+        parts.append("\n// Operations\n")
         current_level = 0
         previous_level = 0
         for level, operation in self._program:
             current_level = level
             if current_level > previous_level:
                 # indent
-                program += textwrap.indent("{\n", "  " * (level - 1))
+                parts.append("  " * (level - 1) + "{\n")
             elif current_level < previous_level:
                 # dedent
-                program += textwrap.indent("}\n", "  " * (level - 1))
+                parts.append("  " * (level - 1) + "}\n")
 
-            program += textwrap.indent(operation + "\n", "  " * level)
+            # textwrap.indent is only needed for multi-line and blank operations
+            if operation.strip() and "\n" not in operation:
+                parts.append(f"{'  ' * level}{operation}\n")
+            else:
+                parts.append(textwrap.indent(operation + "\n", "  " * level))
             previous_level = level
 
         if current_level == 1:
             # dedent
-            program += "}\n"
+            parts.append("}\n")
 
-        return program
+        return "".join(parts)
 
 
 def add_wait(
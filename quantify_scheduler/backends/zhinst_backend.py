@@ -28,6 +28,7 @@ from quantify_scheduler.backends.zhinst import resolvers, seqc_il_generator
 from quantify_scheduler.backends.zhinst import settings as zi_settings
 from quantify_scheduler.helpers import schedule as schedule_helpers
 from quantify_scheduler.helpers import waveforms as waveform_helpers
+from quantify_scheduler.helpers.waveforms import _get_num_samples
 from quantify_scheduler.helpers.collections import (
     find_all_port_clock_combinations,
     find_port_clock_path,
@@ -575,6 +576,9 @@ def apply_waveform_corrections(
     """
 
     (start_in_seconds, duration_in_seconds) = start_and_duration_in_seconds
+    # Same sample count as used by waveform_helpers.get_waveform, so that the time
+    # axis used for modulation matches the waveform.
+    num_samples = _get_num_samples(duration_in_seconds, instrument_info.sample_rate)
 
     if output.modulation.type == zhinst.ModulationModeType.MODULATE:
         raise NotImplementedError("Hardware real-time modulation is not available yet!")
@@ -582,8 +586,8 @@ def apply_waveform_corrections(
     if is_pulse:
         # Modulate the waveform
         if output.modulation.type == zhinst.ModulationModeType.PREMODULATE:
-            t: np.ndarray = np.arange(
-                0, 0 + duration_in_seconds, 1 / instrument_info.sample_rate
+            t: np.ndarray = np.arange(num_samples, dtype=np.float64) * (
+                1 / instrument_info.sample_rate
             )
             waveform = waveform_helpers.modulate_waveform(
                 t, waveform, output.modulation.interm_freq
@@ -597,8 +601,8 @@ def apply_waveform_corrections(
     # in the case where the waveform is an integration weight
     elif output.modulation.type == zhinst.ModulationModeType.PREMODULATE:
         # Modulate the waveform
-        t: np.ndarray = np.arange(
-            0, 0 + duration_in_seconds, 1 / instrument_info.sample_rate
+        t: np.ndarray = np.arange(num_samples, dtype=np.float64) * (
+            1 / instrument_info.sample_rate
         )
         # N.B. the minus sign with respect to the pulse being applied
         waveform = waveform_helpers.modulate_waveform(
@@ -122,6 +122,11 @@ class ScheduleGettable:
         self.always_initialize = always_initialize
         self.is_initialized = False
         self._compiled_schedule: CompiledSchedule | None = None
+        # acquisition metadata of the compiled schedule it was extracted from, so that
+        # it is only extracted once per compiled schedule.
+        self._acq_metadata_cache: tuple[
+            CompiledSchedule, AcquisitionMetadata
+        ] | None = None
 
         self.real_imag = real_imag
         if self.real_imag:
@@ -203,6 +208,24 @@ class ScheduleGettable:
         """Return the schedule used in this class"""
         return self._compiled_schedule
 
+    def _get_acq_metadata(self) -> AcquisitionMetadata:
+        """
+        Return the acquisition metadata of the compiled schedule.
+
+        The metadata is extracted only once per compiled schedule, as it does not
+        change between subsequent calls to :meth:`get` without reinitialization.
+        """
+        compiled_schedule = self.compiled_schedule
+        if (
+            self._acq_metadata_cache is None
+            or self._acq_metadata_cache[0] is not compiled_schedule
+        ):
+            self._acq_metadata_cache = (
+                compiled_schedule,
+                extract_acquisition_metadata_from_schedule(compiled_schedule),
+            )
+        return self._acq_metadata_cache[1]
+
     def get(self) -> tuple[np.ndarray, ...]:
         """
         Start the experimental sequence and retrieve acquisition data.
@@ -237,9 +260,7 @@ class ScheduleGettable:
         acquired_data = instr_coordinator.retrieve_acquisition()
         instr_coordinator.stop()
 
-        acq_metadata = extract_acquisition_metadata_from_schedule(
-            self.compiled_schedule
-        )
+        acq_metadata = self._get_acq_metadata()
 
         if len(acquired_data) == 0 and len(acq_metadata.acq_indices) != 0:
             raise RuntimeError(
@@ -3,8 +3,7 @@
 """Schedule helper functions."""
 from __future__ import annotations
 
-from itertools import chain
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
 
 import numpy as np
 from quantify_scheduler.helpers.collections import make_hash, without
@@ -204,22 +203,25 @@ def get_port_timeline(
         )
     )
 
+    # The uuids of the pulses and acquisitions are computed once per operation.
+    uuids_by_operation: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
     for timeslot_index, schedulable in schedulables_map.items():
-        operation = schedule.operations[schedulable["operation_repr"]]
+        operation_repr = schedulable["operation_repr"]
         abs_time = schedulable["abs_time"]
 
-        pulse_info_iter = map(
-            lambda pulse_info: (get_pulse_uuid(pulse_info), pulse_info),
-            operation["pulse_info"],
-        )
-        acq_info_iter = map(
-            lambda acq_info: (get_acq_uuid(acq_info), acq_info),
-            operation["acquisition_info"],
-        )
+        if operation_repr not in uuids_by_operation:
+            operation = schedule.operations[operation_repr]
+            uuids_by_operation[operation_repr] = [
+                (get_pulse_uuid(pulse_info), pulse_info)
+                for pulse_info in operation["pulse_info"]
+            ] + [
+                (get_acq_uuid(acq_info), acq_info)
+                for acq_info in operation["acquisition_info"]
+            ]
 
         # Sort pulses and acquisitions within an operation.
         for uuid, info in sorted(
-            chain(pulse_info_iter, acq_info_iter),
+            uuids_by_operation[operation_repr],
             key=lambda pair: abs_time  # pylint: disable=cell-var-from-loop
             + pair[1]["t0"],
         ):
@@ -269,6 +271,23 @@ def get_schedule_time_offset(
     )
 
 
+def _get_unique_operations(schedule: ScheduleBase) -> Iterator[Operation]:
+    """
+    Yield the operations played by the schedulables of a schedule, each only once,
+    in the order in which they are first played.
+
+    An operation is typically played by many schedulables, and helpers that only
+    depend on the operation itself need to visit it once.
+    """
+    visited_operations = set()
+    for schedulable in schedule.schedulables.values():
+        operation_repr = schedulable["operation_repr"]
+        if operation_repr in visited_operations:
+            continue
+        visited_operations.add(operation_repr)
+        yield schedule.operations[operation_repr]
+
+
 def get_pulse_info_by_uuid(
     schedule: CompiledSchedule,
 ) -> Dict[int, Dict[str, Any]]:
@@ -283,8 +302,7 @@ def get_pulse_info_by_uuid(
     """
 
     pulseid_pulseinfo_dict: Dict[int, Dict[str, Any]] = {}
-    for schedulable in schedule.schedulables.values():
-        operation = schedule.operations[schedulable["operation_repr"]]
+    for operation in _get_unique_operations(schedule):
         for pulse_info in operation["pulse_info"]:
             pulse_id = get_pulse_uuid(pulse_info)
             if pulse_id in pulseid_pulseinfo_dict:
@@ -317,9 +335,7 @@ def get_acq_info_by_uuid(schedule: CompiledSchedule) -> Dict[int, Dict[str, Any]
     """
 
     acqid_acqinfo_dict: Dict[int, Dict[str, Any]] = {}
-    for schedulable in schedule.schedulables.values():
-        operation = schedule.operations[schedulable["operation_repr"]]
-
+    for operation in _get_unique_operations(schedule):
         for acq_info in operation["acquisition_info"]:
             acq_id = get_acq_uuid(acq_info)
             if acq_id in acqid_acqinfo_dict:
@@ -12,7 +12,9 @@ import math
 from quantify_scheduler import math as math_helpers, waveforms
 from quantify_scheduler.schedules.schedule import Schedule
 from quantify_scheduler.helpers import schedule as schedule_helpers
+from quantify_scheduler.helpers.schedule import _get_unique_operations
 from quantify_scheduler.helpers.importers import import_python_object_from_string
+from quantify_scheduler.json_utils import lru_cache
 
 
 # pylint: disable=too-few-public-methods
@@ -149,6 +151,30 @@ def shift_waveform(
     return start_in_sequencer_count, np.concatenate([np.zeros(samples_shift), waveform])
 
 
+def _get_num_samples(duration: float, sampling_rate: float) -> int:
+    """
+    Returns the number of samples of a waveform with the given duration.
+
+    This is the number of samples :func:`get_waveform` uses, and should be used for
+    any time axis that has to match a sampled waveform. Unlike a fractional stop
+    value in :func:`numpy.arange`, it does not include an extra sample due to
+    round-off errors.
+
+    Parameters
+    ----------
+    duration
+        The duration of the waveform in seconds.
+    sampling_rate
+        The sampling rate in Hz.
+
+    Returns
+    -------
+    :
+        The number of samples.
+    """
+    return math.ceil(round(duration * sampling_rate, 9))
+
+
 def get_waveform(
     pulse_info: Dict[str, Any],
     sampling_rate: float,
@@ -168,7 +194,8 @@ def get_waveform(
     :
         The waveform.
     """
-    t: np.ndarray = np.arange(0, 0 + pulse_info["duration"], 1 / sampling_rate)
+    num_samples = _get_num_samples(pulse_info["duration"], sampling_rate)
+    t: np.ndarray = np.arange(num_samples, dtype=np.float64) * (1 / sampling_rate)
     wf_func: str = pulse_info["wf_func"]
     waveform: np.ndarray = exec_waveform_function(wf_func, t, pulse_info)
 
@@ -191,8 +218,7 @@ def get_waveform_by_pulseid(
         The schedule.
     """
     pulseid_waveformfn_dict: Dict[int, GetWaveformPartial] = {}
-    for schedulable in schedule.schedulables.values():
-        operation = schedule.operations[schedulable["operation_repr"]]
+    for operation in _get_unique_operations(schedule):
         for pulse_info in operation["pulse_info"]:
             pulse_id = schedule_helpers.get_pulse_uuid(pulse_info)
             if pulse_id in pulseid_waveformfn_dict:
@@ -246,6 +272,33 @@ def exec_waveform_partial(
     return waveform
 
 
+_WHITELISTED_WAVEFORMS = frozenset(("square", "ramp", "soft_square", "drag"))
+
+
+def _is_whitelisted_waveform_function(wf_func: str) -> bool:
+    """
+    Whether ``wf_func`` is evaluated by :func:`exec_waveform_function` itself,
+    rather than by :func:`exec_custom_waveform_function`.
+    """
+    return wf_func.rsplit(".", 1)[-1] in _WHITELISTED_WAVEFORMS and wf_func.startswith(
+        "quantify_scheduler.waveforms"
+    )
+
+
+def _get_parameter_names(function) -> Tuple[str, ...]:
+    """Returns the parameter names of a (custom) waveform function."""
+    try:
+        return _get_parameter_names_cached(function)
+    except TypeError:
+        # unhashable callable
+        return tuple(inspect.signature(function).parameters)
+
+
+@lru_cache
+def _get_parameter_names_cached(function) -> Tuple[str, ...]:
+    return tuple(inspect.signature(function).parameters)
+
+
 def exec_waveform_function(wf_func: str, t: np.ndarray, pulse_info: dict) -> np.ndarray:
     """
     Returns the result of the pulse's waveform function.
@@ -268,10 +321,9 @@ def exec_waveform_function(wf_func: str, t: np.ndarray, pulse_info: dict) -> np.
     :
         Returns the computed waveform.
     """
-    whitelist: List[str] = ["square", "ramp", "soft_square", "drag"]
-    fn_name: str = wf_func.split(".")[-1]
+    fn_name: str = wf_func.rsplit(".", 1)[-1]
     waveform: np.ndarray = []
-    if wf_func.startswith("quantify_scheduler.waveforms") and fn_name in whitelist:
+    if _is_whitelisted_waveform_function(wf_func):
         if fn_name == "square":
             waveform = waveforms.square(t=t, amp=pulse_info["amp"])
         elif fn_name == "ramp":
@@ -327,11 +379,11 @@ def exec_custom_waveform_function(
 
     # select the arguments for the waveform function that are present
     # in pulse info
-    par_map = inspect.signature(function).parameters
-    wf_kwargs = {}
-    for key in par_map.keys():
-        if key in pulse_info:
-            wf_kwargs[key] = pulse_info[key]
+    wf_kwargs = {
+        key: pulse_info[key]
+        for key in _get_parameter_names(function)
+        if key in pulse_info
+    }
 
     # Calculate the numerical waveform using the wf_func
     return function(t=t, **wf_kwargs)
@@ -372,32 +424,30 @@ def apply_mixer_skewness_corrections(
         corrections.
     """
 
-    def skew_real(_waveform: np.ndarray, alpha: float, phi: float):
-        original_amp = np.max(np.abs(_waveform.real))
-        intermediate_wf = _waveform.real + _waveform.imag * np.tan(phi)
-        new_amp = np.max(np.abs(intermediate_wf))
-        intermediate_wf = (
-            intermediate_wf / new_amp
-            if new_amp != 0
-            else np.zeros(intermediate_wf.shape)
-        )
-        return intermediate_wf * original_amp * np.sqrt(alpha)
-
-    def skew_imag(_waveform: np.ndarray, alpha: float, phi: float):
-        original_amp = np.max(np.abs(_waveform.imag))
-        intermediate_wf = _waveform.imag / np.cos(phi)
-        new_amp = np.max(np.abs(intermediate_wf))
-        intermediate_wf = (
-            intermediate_wf / new_amp
-            if new_amp != 0
-            else np.zeros(intermediate_wf.shape)
-        )
-        return intermediate_wf * original_amp / np.sqrt(alpha)
+    phi = np.deg2rad(phase_shift)
+    corrected = np.empty(waveform.shape, dtype=np.complex128)
+    # The corrected paths are written in place into views of the output and the
+    # rescaling to the original amplitudes is folded into one factor per path.
+    corrected_re, corrected_im = corrected.real, corrected.imag
+
+    np.multiply(waveform.imag, np.tan(phi), out=corrected_re)
+    corrected_re += waveform.real
+    new_amp = np.max(np.abs(corrected_re))
+    corrected_re *= (
+        np.max(np.abs(waveform.real)) * np.sqrt(amplitude_ratio) / new_amp
+        if new_amp != 0
+        else 0
+    )
 
-    corrected_re = skew_real(waveform, amplitude_ratio, np.deg2rad(phase_shift))
-    corrected_im = skew_imag(waveform, amplitude_ratio, np.deg2rad(phase_shift))
+    np.divide(waveform.imag, np.cos(phi), out=corrected_im)
+    new_amp = np.max(np.abs(corrected_im))
+    corrected_im *= (
+        np.max(np.abs(waveform.imag)) / np.sqrt(amplitude_ratio) / new_amp
+        if new_amp != 0
+        else 0
+    )
 
-    return corrected_re + 1.0j * corrected_im
+    return corrected
 
 
 def modulate_waveform(
@@ -430,8 +480,18 @@ def modulate_waveform(
     :
         The modulated waveform
     """
-    modulation = np.exp(1.0j * 2 * np.pi * freq * (t + t0))
-    return envelope * modulation
+    phase = np.add(t, t0, dtype=np.float64)
+    phase *= 2 * np.pi * freq
+    # Evaluating the cosine and sine of the real phase directly into the output is
+    # cheaper than the complex exponential of a complex array.
+    modulation = np.empty(phase.shape, dtype=np.complex128)
+    np.cos(phase, out=modulation.real)
+    np.sin(phase, out=modulation.imag)
+    if np.broadcast(modulation, envelope).shape != modulation.shape:
+        # The envelope does not broadcast into the shape of t.
+        return np.multiply(envelope, modulation)
+    modulation *= envelope
+    return modulation
 
 
 def normalize_waveform_data(data: np.ndarray) -> Tuple[np.ndarray, float, float]:
@@ -526,5 +586,28 @@ def area_pulse(pulse: Dict[str, Any], sampling_rate: float) -> float:
     if pulse["wf_func"] == "quantify_scheduler.waveforms.square":
         return pulse["amp"] * pulse["duration"]
 
+    # The mean of the sampled ramp and staircase waveforms is known in closed form,
+    # which avoids generating the samples of (long) pulses.
+    num_samples = _get_num_samples(pulse["duration"], sampling_rate)
+    if num_samples > 0:
+        if pulse["wf_func"] == "quantify_scheduler.waveforms.ramp":
+            mean = pulse.get("offset", 0) + pulse["amp"] * (num_samples - 1) / (
+                2 * num_samples
+            )
+            return mean * pulse["duration"]
+        if (
+            pulse["wf_func"] == "quantify_scheduler.waveforms.staircase"
+            and pulse["num_steps"] > 1
+        ):
+            # Equally long plateaus linearly spaced between start_amp and final_amp,
+            # the remaining samples are at final_amp.
+            num_steps = pulse["num_steps"]
+            plateau_len = num_samples // num_steps
+            total = (
+                plateau_len * num_steps * (pulse["start_amp"] + pulse["final_amp"]) / 2
+                + (num_samples - plateau_len * num_steps) * pulse["final_amp"]
+            )
+            return total / num_samples * pulse["duration"]
+
     waveform: np.ndarray = get_waveform(pulse, sampling_rate)
     return waveform.mean() * pulse["duration"]
@@ -372,7 +372,7 @@ def long_ramp_pulse(
     for _ in range(num_whole_parts):
         if not (math.isclose(offset, 0) and math.isclose(cur_offset, offset)):
             builder.add_voltage_offset(path_0=cur_offset, path_1=0.0)
-        builder.add_pulse(
+        builder._add_pulse_unchecked(
             pulse_library.RampPulse(
                 amp=amp_part, duration=part_duration_ns * 1e-9, port=port
             )
@@ -380,7 +380,7 @@ def long_ramp_pulse(
         cur_offset += amp_part
     if cur_offset != offset:
         builder.add_voltage_offset(path_0=cur_offset, path_1=0.0)
-    builder.add_pulse(
+    builder._add_pulse_unchecked(
         pulse_library.RampPulse(amp=amp_left, duration=dur_left, port=port)
     )
 
@@ -2,10 +2,12 @@
 # Licensed according to the LICENCE file on the main branch
 from __future__ import annotations
 
+import bisect
 import math
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass
-from typing import Any, List
+from itertools import chain
+from typing import Any, Iterable, List
 
 import numpy as np
 
@@ -35,9 +37,10 @@ class StitchedPulse(Operation):
             A list containing the pulses that are part of the StitchedPulse. By default
             None.
         """
-        pulse_info = pulse_info or []
         super().__init__(name=self.__class__.__name__)
-        self.data["pulse_info"] = pulse_info
+        # A shallow copy suffices to prevent adding pulses from extending the list
+        # that was passed in. The pulse_info dicts themselves are not copied.
+        self.data["pulse_info"] = list(pulse_info or [])
         self._update()
 
     def __str__(self) -> str:
@@ -66,6 +69,24 @@ class StitchedPulse(Operation):
 
         super().add_pulse(pulse_operation)
 
+    def _extend_pulses(self, pulse_infos: Iterable[dict[str, Any]]) -> None:
+        """
+        Adds multiple pulse_info dicts to this Operation.
+
+        The duration is updated using only the added pulse_info, instead of
+        recomputing it from all components.
+
+        The ports and clocks of the pulse_info are not checked, so this should only be
+        used for pulse_info that is already guaranteed to match, such as that added by
+        :meth:`.StitchedPulseBuilder.build`.
+        """
+        all_pulse_info = self.data["pulse_info"]
+        duration = self._duration
+        for pulse_info in pulse_infos:
+            all_pulse_info.append(pulse_info)
+            duration = max(duration, pulse_info["t0"] + pulse_info["duration"])
+        self._duration = duration
+
     def _pulse_and_clock_match(self, operation_info: List[dict[str, Any]]) -> bool:
         """
         Check if the port and clock of an operation match the ports and clocks of the
@@ -183,10 +204,17 @@ def convert_to_numerical_pulse(
 
 @dataclass
 class _VoltageOffsetInfo:
+    # Explicit __slots__, because dataclass(slots=True) requires Python 3.10.
+    __slots__ = ("path_0", "path_1", "t0", "duration", "end")
+
     path_0: float
     path_1: float
     t0: float
-    duration: float | None = None
+    duration: float | None
+
+    def __post_init__(self) -> None:
+        # Not a dataclass field, since a field default would conflict with __slots__.
+        self.end = self.t0 + (self.duration or 0.0)
 
 
 class StitchedPulseBuilder:
@@ -216,7 +244,16 @@ class StitchedPulseBuilder:
         self._clock = clock
         self._t0 = t0
         self._pulses: List[Operation] = []
+        # The offsets are kept sorted by t0, with the t0 values stored separately for
+        # bisecting.
         self._offsets: List[_VoltageOffsetInfo] = []
+        self._offset_t0s: List[float] = []
+        # End time of the StitchedPulse so far, updated whenever a pulse or offset is
+        # added so that it does not need to be recomputed from all components.
+        self._operation_end: float = 0.0
+        # Offset instructions including the resets, computed on the first build and
+        # reused until a pulse or offset is added.
+        self._offset_infos_cache: List[_VoltageOffsetInfo] | None = None
 
     def set_port(self, port: str) -> StitchedPulseBuilder:
         """
@@ -314,11 +351,33 @@ class StitchedPulseBuilder:
                 "`add_voltage_offset` instead."
             )
 
-        pulse = deepcopy(pulse)  # we will modify it
-        if append:
-            for pulse_info in pulse["pulse_info"]:
-                pulse_info["t0"] += self.operation_end
+        return self._add_pulse_unchecked(pulse, append)
+
+    def _add_pulse_unchecked(
+        self, pulse: Operation, append: bool = True
+    ) -> StitchedPulseBuilder:
+        """
+        Add an Operation to the StitchedPulse without checking that it is a valid
+        pulse. Only for operations that are known to contain nothing but pulse_info
+        without voltage offsets, such as pulses created by the pulse factories. See
+        :meth:`~.add_pulse`.
+        """
+        # Only the pulse_info dicts are modified by the builder, so copying those
+        # suffices to leave the original operation untouched.
+        pulse = copy(pulse)
+        pulse.data = {
+            **pulse.data,
+            "pulse_info": [dict(pulse_info) for pulse_info in pulse["pulse_info"]],
+        }
+        operation_end = self._operation_end
+        pulse_end = operation_end
+        for pulse_info in pulse.data["pulse_info"]:
+            if append:
+                pulse_info["t0"] += operation_end
+            pulse_end = max(pulse_end, pulse_info["t0"] + pulse_info["duration"])
         self._pulses.append(pulse)
+        self._offset_infos_cache = None
+        self._operation_end = pulse_end
         return self
 
     def add_voltage_offset(
@@ -376,47 +435,47 @@ class StitchedPulseBuilder:
         offset = _VoltageOffsetInfo(
             path_0=path_0, path_1=path_1, t0=rel_time, duration=duration
         )
-        if self._overlaps_with_existing_offsets(offset):
+        insert_idx = bisect.bisect_right(self._offset_t0s, offset.t0)
+        if self._overlaps_with_existing_offsets(offset, insert_idx):
             raise RuntimeError(
                 "Tried to add offset that overlaps with existing offsets in the "
                 "StitchedPulse."
             )
 
-        self._offsets.append(offset)
+        self._offsets.insert(insert_idx, offset)
+        self._offset_t0s.insert(insert_idx, offset.t0)
+        self._offset_infos_cache = None
+        self._operation_end = max(self._operation_end, offset.end)
         return self
 
     @property
     def operation_end(self) -> float:
-        max_from_pulses: float = (
-            0.0
-            if len(self._pulses) == 0
-            else max(
-                pulse_info["t0"] + pulse_info["duration"]
-                for op in self._pulses
-                for pulse_info in op.data["pulse_info"]
-            )
-        )
-        max_from_offsets: float = (
-            0.0
-            if len(self._offsets) == 0
-            else max(offs.t0 + (offs.duration or 0.0) for offs in self._offsets)
-        )
-        return max(max_from_pulses, max_from_offsets)
+        """
+        The end time of the StitchedPulse, determined by the pulses and offsets that
+        have been added so far.
+        """
+        return self._operation_end
 
-    def _distribute_port_clock(self) -> None:
+    def _build_pulse_infos(self) -> List[dict[str, Any]]:
+        """
+        Return copies of the pulse_info of the added pulses, with the port, clock and
+        t0 of the StitchedPulse applied. The pulses of the builder are left untouched,
+        so that building repeatedly gives the same result.
+        """
         if self._port is None:
             raise RuntimeError("No port is defined.")
         if self._clock is None:
             raise RuntimeError("No clock is defined.")
-        for op in self._pulses:
-            for pulse_info in op.data["pulse_info"]:
-                pulse_info["port"] = self._port
-                pulse_info["clock"] = self._clock
-
-    def _distribute_t0(self) -> None:
-        for op in self._pulses:
-            for pulse_info in op.data["pulse_info"]:
-                pulse_info["t0"] += self._t0
+        return [
+            {
+                **pulse_info,
+                "port": self._port,
+                "clock": self._clock,
+                "t0": pulse_info["t0"] + self._t0,
+            }
+            for op in self._pulses
+            for pulse_info in op.data["pulse_info"]
+        ]
 
     def _build_voltage_offset_operations(self) -> List[VoltageOffset]:
         """
@@ -430,13 +489,13 @@ class StitchedPulseBuilder:
         At the end of the StitchedPulse, the offset will be reset to 0.
 
         An offset does not need to be reset, if at the end of its duration, another
-        offset instruction starts.
+        offset instruction starts, or if it is equal to the offset it would be reset to.
         """
-        if len(self._offsets) == 0:
-            return []
+        if self._offset_infos_cache is None:
+            self._offset_infos_cache = self._get_voltage_offset_infos()
 
-        def create_operation_from_info(info: _VoltageOffsetInfo) -> VoltageOffset:
-            return VoltageOffset(
+        return [
+            VoltageOffset(
                 offset_path_0=info.path_0,
                 offset_path_1=info.path_1,
                 duration=info.duration or 0.0,
@@ -444,15 +503,24 @@ class StitchedPulseBuilder:
                 clock=self._clock,
                 t0=info.t0,
             )
+            for info in self._offset_infos_cache
+        ]
 
-        offset_ops: List[VoltageOffset] = []
-        offset_infos = sorted(
-            self._offsets,
-            key=lambda op: op.t0,
-        )
+    def _get_voltage_offset_infos(self) -> List[_VoltageOffsetInfo]:
+        """
+        Return the added offsets together with the offsets that reset them, in the
+        order in which they should be added to the StitchedPulse. See
+        :meth:`~._build_voltage_offset_operations`.
+        """
+        if len(self._offsets) == 0:
+            return []
+
+        offset_infos: List[_VoltageOffsetInfo] = []
+        operation_end = self.operation_end
+        n_offsets = len(self._offsets)
         background = (0.0, 0.0)
-        for i, offset_info in enumerate(offset_infos):
-            offset_ops.append(create_operation_from_info(offset_info))
+        for i, offset_info in enumerate(self._offsets):
+            offset_infos.append(offset_info)
 
             if offset_info.duration is None:
                 # If no duration was specified, this offset should hold until the end of
@@ -463,38 +531,47 @@ class StitchedPulseBuilder:
                 )
                 continue
 
-            this_end = offset_info.t0 + (offset_info.duration or 0.0)
-            if math.isclose(this_end, self.operation_end):
+            this_end = offset_info.end
+            if math.isclose(this_end, operation_end):
                 background = (0.0, 0.0)
+            if math.isclose(offset_info.path_0, background[0]) and math.isclose(
+                offset_info.path_1, background[1]
+            ):
+                # The offset equals the background, so resetting it has no effect.
+                continue
             # Reset if the next offset's start does not overlap with the current
             # offset's end, or if the current offset is the last one
-            if i + 1 >= len(self._offsets) or not math.isclose(
+            if i + 1 >= n_offsets or not math.isclose(
                 self._offsets[i + 1].t0, this_end
             ):
-                offset_ops.append(
-                    create_operation_from_info(
-                        _VoltageOffsetInfo(background[0], background[1], t0=this_end)
+                offset_infos.append(
+                    _VoltageOffsetInfo(
+                        background[0], background[1], t0=this_end, duration=None
                     )
                 )
 
         # If this wasn't done yet, add a reset to 0 at the end of the StitchedPulse
         if not (math.isclose(background[0], 0) and math.isclose(background[1], 0)):
-            offset_ops.append(
-                create_operation_from_info(
-                    _VoltageOffsetInfo(0.0, 0.0, t0=self.operation_end)
-                )
+            offset_infos.append(
+                _VoltageOffsetInfo(0.0, 0.0, t0=operation_end, duration=None)
             )
 
-        return offset_ops
+        return offset_infos
 
-    def _overlaps_with_existing_offsets(self, offset: _VoltageOffsetInfo) -> bool:
-        offsets = self._offsets[:]
-        offsets.append(offset)
-        offsets.sort(key=lambda op: op.t0)
-        for i, offs in enumerate(offsets[:-1]):
-            next_start = offsets[i + 1].t0
-            this_end = offs.t0 + (offs.duration or 0.0)
-            if next_start < this_end:
+    def _overlaps_with_existing_offsets(
+        self, offset: _VoltageOffsetInfo, insert_idx: int
+    ) -> bool:
+        """
+        Check whether an offset inserted at ``insert_idx`` in the sorted offsets
+        overlaps with its neighbours. The existing offsets do not overlap with each
+        other, so only the direct neighbours need to be checked.
+        """
+        if insert_idx > 0:
+            previous = self._offsets[insert_idx - 1]
+            if offset.t0 < previous.end:
+                return True
+        if insert_idx < len(self._offsets):
+            if self._offsets[insert_idx].t0 < offset.end:
                 return True
         return False
 
@@ -507,9 +584,14 @@ class StitchedPulseBuilder:
         StitchedPulse
         """
         offsets = self._build_voltage_offset_operations()
-        self._distribute_port_clock()
-        self._distribute_t0()
+        pulse_infos = self._build_pulse_infos()
         stitched_pulse = StitchedPulse()
-        for op in self._pulses + offsets:
-            stitched_pulse.add_pulse(op)
+        # _build_pulse_infos ensures that all components share the same port and
+        # clock.
+        stitched_pulse._extend_pulses(
+            chain(
+                pulse_infos,
+                (pulse_info for op in offsets for pulse_info in op.data["pulse_info"]),
+            )
+        )
         return stitched_pulse
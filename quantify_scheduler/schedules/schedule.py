@@ -13,6 +13,7 @@ from itertools import chain
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 
 from quantify_scheduler import enums, json_utils, resources
@@ -20,7 +21,6 @@ from quantify_scheduler.json_utils import JSONSchemaValMixin
 from quantify_scheduler.operations.operation import Operation
 
 if TYPE_CHECKING:
-    import numpy as np
     import plotly.graph_objects as go
     from matplotlib.axes import Axes
     from matplotlib.figure import Figure
@@ -28,6 +28,24 @@ if TYPE_CHECKING:
     from quantify_scheduler.resources import Resource
 
 
+def _format_ns(val: float) -> str:
+    return f"{val*1e9:,.1f} ns"
+
+
+def _format_float(val: float) -> str:
+    return f"{val:,.1f}"
+
+
+# Styler formatters for the timing tables. These work under the assumption that we
+# are using timings on the order of nanoseconds.
+_TIMING_TABLE_FORMATTERS = {"abs_time": _format_ns, "duration": _format_ns}
+_HARDWARE_TIMING_TABLE_FORMATTERS = {
+    **_TIMING_TABLE_FORMATTERS,
+    "clock_cycle_start": _format_float,
+    "sample_start": _format_float,
+}
+
+
 # pylint: disable=too-many-ancestors
 class ScheduleBase(JSONSchemaValMixin, UserDict, ABC):
     # pylint: disable=line-too-long
@@ -158,9 +176,9 @@ class ScheduleBase(JSONSchemaValMixin, UserDict, ABC):
     def __repr__(self) -> str:
         """Return a string representation of this instance."""
         return (
-            f'{self.__class__.__name__} "{self["name"]}" containing '
-            f'({len(self["operation_dict"])}) '
-            f"{len(self.schedulables)}  (unique) operations."
+            f'{self.__class__.__name__} "{self.data["name"]}" containing '
+            f'({len(self.data["operation_dict"])}) '
+            f'{len(self.data["schedulables"])}  (unique) operations.'
         )
 
     def to_json(self) -> str:
@@ -172,7 +190,12 @@ class ScheduleBase(JSONSchemaValMixin, UserDict, ABC):
         :
             The json string result.
         """
-        return json.dumps(self.data, cls=json_utils.ScheduleJSONEncoder)
+        return json.dumps(
+            self.data,
+            cls=json_utils.ScheduleJSONEncoder,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
 
     @classmethod
     def from_json(cls, data: str) -> Schedule:
@@ -455,57 +478,80 @@ class ScheduleBase(JSONSchemaValMixin, UserDict, ABC):
         ValueError
             When the absolute timing has not been determined during compilation.
         """  # noqa: E501
-        timing_table = pd.DataFrame(
-            columns=[
-                "waveform_op_id",  # a readable id based on the operation
-                "port",
-                "clock",
-                "is_acquisition",  # a bool which helps determine if an operation is
-                # an acquisition or not. (True is it is an acquisition operation)
-                "abs_time",  # start of the operation in absolute time (s)
-                "duration",  # duration of the operation in absolute time (s)
-                "operation",
-                "wf_idx",
-                "operation_hash",
-            ]
-        )
-
-        timing_table_list = [timing_table]
+        columns = [
+            "waveform_op_id",  # a readable id based on the operation
+            "port",
+            "clock",
+            "is_acquisition",  # a bool which helps determine if an operation is
+            # an acquisition or not. (True is it is an acquisition operation)
+            "abs_time",  # start of the operation in absolute time (s)
+            "duration",  # duration of the operation in absolute time (s)
+            "operation",
+            "wf_idx",
+            "operation_hash",
+        ]
+
+        # The table is assembled column-wise. The rows of an operation are the same
+        # for all schedulables using it, apart from the absolute time, so they are
+        # derived once per operation and stored as template rows. Each schedulable
+        # then only records which template rows it uses and its own start time.
+        template_columns: dict[str, list] = {column: [] for column in columns}
+        # operation hash -> range of the template rows of that operation
+        template_rows: dict[str, range] = {}
+        row_indices: list[int] = []
+        row_start_times: list[float] = []
+        operations = self.operations
         for schedulable in self.schedulables.values():
-            if "abs_time" not in schedulable:
-                # when this exception is encountered
-                raise ValueError("Absolute time has not been determined yet.")
-            operation = self.operations[schedulable["operation_repr"]]
-
-            for i, op_info in chain(
-                enumerate(operation["pulse_info"]),
-                enumerate(operation["acquisition_info"]),
-            ):
-                abs_time = op_info["t0"] + schedulable["abs_time"]
-                df_row = {
-                    "waveform_op_id": str(operation) + f"_acq_{i}",
-                    "port": op_info["port"],
-                    "clock": op_info["clock"],
-                    "abs_time": abs_time,
-                    "duration": op_info["duration"],
-                    "is_acquisition": "acq_channel" in op_info or "bin_mode" in op_info,
-                    "operation": str(
-                        operation
-                    ),  # this field is not the operation itself, but its repr
-                    "wf_idx": i,
-                    "operation_hash": schedulable["operation_repr"],
-                }
-                timing_table_list.append(pd.DataFrame(df_row, index=range(1)))
-        timing_table = pd.concat(timing_table_list, ignore_index=True)
+            try:
+                schedulable_abs_time = schedulable["abs_time"]
+            except KeyError as err:
+                raise ValueError("Absolute time has not been determined yet.") from err
+            operation_hash = schedulable["operation_repr"]
+
+            rows = template_rows.get(operation_hash)
+            if rows is None:
+                operation = operations[operation_hash]
+                # this field is not the operation itself, but its repr
+                operation_str = str(operation)
+                first_row = len(template_columns["operation_hash"])
+                for i, op_info in chain(
+                    enumerate(operation["pulse_info"]),
+                    enumerate(operation["acquisition_info"]),
+                ):
+                    template_columns["waveform_op_id"].append(
+                        f"{operation_str}_acq_{i}"
+                    )
+                    template_columns["port"].append(op_info["port"])
+                    template_columns["clock"].append(op_info["clock"])
+                    template_columns["is_acquisition"].append(
+                        "acq_channel" in op_info or "bin_mode" in op_info
+                    )
+                    # relative to the start of the operation
+                    template_columns["abs_time"].append(op_info["t0"])
+                    template_columns["duration"].append(op_info["duration"])
+                    template_columns["operation"].append(operation_str)
+                    template_columns["wf_idx"].append(i)
+                    template_columns["operation_hash"].append(operation_hash)
+                rows = range(first_row, len(template_columns["operation_hash"]))
+                template_rows[operation_hash] = rows
+
+            row_indices.extend(rows)
+            row_start_times.extend([schedulable_abs_time] * len(rows))
+
+        table_columns = {}
+        for column, values in template_columns.items():
+            if column in ("abs_time", "duration"):
+                template = np.asarray(values, dtype=float)
+            else:
+                # object arrays keep python bools and ints in the table, as before
+                template = np.empty(len(values), dtype=object)
+                template[:] = values
+            table_columns[column] = template.take(row_indices)
+        table_columns["abs_time"] += row_start_times
+
+        timing_table = pd.DataFrame(table_columns, columns=columns)
         # apply a style so that time is easy to read.
-        # this works under the assumption that we are using timings on the order of
-        # nanoseconds.
-        styled_timing_table = timing_table.style.format(
-            {
-                "abs_time": lambda val: f"{val*1e9:,.1f} ns",
-                "duration": lambda val: f"{val*1e9:,.1f} ns",
-            }
-        )
+        styled_timing_table = timing_table.style.format(_TIMING_TABLE_FORMATTERS)
         return styled_timing_table
 
     def get_schedule_duration(self) -> float:
@@ -519,24 +565,28 @@ class ScheduleBase(JSONSchemaValMixin, UserDict, ABC):
 
         """
         schedule_duration = 0
+        # the end time of each operation is computed only once
+        operation_end_times: dict[str, float] = {}
 
         # find last timestamp
         for schedulable in self.schedulables.values():
-            timestamp = schedulable["abs_time"]
             operation_repr = schedulable["operation_repr"]
 
             # find duration of last operation
-            operation = self["operation_dict"][operation_repr]
-            pulses_end_times = [
-                pulse.get("duration") + pulse.get("t0")
-                for pulse in operation["pulse_info"]
-            ]
-            acquisitions_end_times = [
-                acquisition.get("duration") + acquisition.get("t0")
-                for acquisition in operation["acquisition_info"]
-            ]
-            final_op_len = max(pulses_end_times + acquisitions_end_times, default=0)
-            tmp_time = timestamp + final_op_len
+            final_op_len = operation_end_times.get(operation_repr)
+            if final_op_len is None:
+                operation = self["operation_dict"][operation_repr]
+                final_op_len = max(
+                    (
+                        info["duration"] + info["t0"]
+                        for info in chain(
+                            operation["pulse_info"], operation["acquisition_info"]
+                        )
+                    ),
+                    default=0,
+                )
+                operation_end_times[operation_repr] = final_op_len
+            tmp_time = schedulable["abs_time"] + final_op_len
 
             # keep track of longest found schedule
             if tmp_time > schedule_duration:
@@ -580,24 +630,30 @@ class Schedule(ScheduleBase):  # pylint: disable=too-many-ancestors
         super().__init__()
 
         # ensure keys exist
-        self["operation_dict"] = {}
-        self["schedulables"] = {}
-        self["resource_dict"] = {}
-        self["name"] = "nameless"
-        self["repetitions"] = repetitions
-
-        # This is used to define baseband pulses and is expected to always be present
-        # in any schedule.
-        self.add_resource(
-            resources.BasebandClockResource(resources.BasebandClockResource.IDENTITY)
+        self.data.update(
+            {
+                "operation_dict": {},
+                "schedulables": {},
+                # This is used to define baseband pulses and is expected to always be
+                # present in any schedule. It is known to be valid, so it is added
+                # directly instead of through add_resource.
+                "resource_dict": {
+                    resources.BasebandClockResource.IDENTITY: (
+                        resources.BasebandClockResource(
+                            resources.BasebandClockResource.IDENTITY
+                        )
+                    )
+                },
+                "name": "nameless" if name is None else name,
+                "repetitions": repetitions,
+            }
         )
 
-        if name is not None:
-            self["name"] = name
-
         if data is not None:
             self.data.update(data)
 
+        self._reset_label_generator()
+
     def add_resources(self, resources_list: list) -> None:
         """Add wrapper for adding multiple resources."""
         for resource in resources_list:
@@ -654,7 +710,8 @@ class Schedule(ScheduleBase):  # pylint: disable=too-many-ancestors
 
         label
             a unique string that can be used as an identifier when adding operations.
-            if set to None, a random hash will be generated instead.
+            if set to None, a label that is unique within this schedule will be
+            generated instead.
 
         Returns
         -------
@@ -668,29 +725,32 @@ class Schedule(ScheduleBase):  # pylint: disable=too-many-ancestors
             )
 
         if label is None:
-            label = str(uuid4())
+            label = self._generate_label()
 
         # ensure the schedulable name is unique
         if label in self.schedulables:
             raise ValueError(f"Schedulable name '{label}' must be unique.")
 
         # ensure that reference schedulable exists in current schedule
-        if ref_op is not None and (
-            (isinstance(ref_op, str) and ref_op not in self.schedulables)
-            # in case a user references a schedulable from another schedule
-            # that has a label that exists in this schedule:
-            or (
-                isinstance(ref_op, Schedulable)
-                and self.schedulables.get(str(ref_op)) is not ref_op
-            )
-        ):
-            raise ValueError(
-                f"Reference schedulable '{ref_op}' does not exists in "
-                f"schedule '{self.name}'."
-            )
-
+        if ref_op is not None:
+            if isinstance(ref_op, str):
+                ref_op_exists = ref_op in self.schedulables
+            elif isinstance(ref_op, Schedulable):
+                # in case a user references a schedulable from another schedule
+                # that has a label that exists in this schedule:
+                ref_op_exists = self.schedulables.get(ref_op["name"]) is ref_op
+            else:
+                ref_op_exists = True
+            if not ref_op_exists:
+                raise ValueError(
+                    f"Reference schedulable '{ref_op}' does not exists in "
+                    f"schedule '{self.name}'."
+                )
+
+        # Operations are interned by their hash, so that equal operations added
+        # multiple times share a single object in the operation_dict.
         operation_id = operation.hash
-        self["operation_dict"][operation_id] = operation
+        self["operation_dict"].setdefault(operation_id, operation)
         element = Schedulable(name=label, operation_repr=operation_id)
         element.add_timing_constraint(
             rel_time=rel_time,
@@ -702,11 +762,28 @@ class Schedule(ScheduleBase):  # pylint: disable=too-many-ancestors
 
         return element
 
+    def _reset_label_generator(self) -> None:
+        # Default labels consist of a random prefix, unique to this schedule, and a
+        # counter. Generating a uuid for the schedule instead of for every added
+        # schedulable is cheaper, and the prefix ensures that generated labels do
+        # not clash with user-chosen labels or labels of other schedules.
+        self._label_prefix = f"{uuid4()}-"
+        self._label_counter = 0
+
+    def _generate_label(self) -> str:
+        """Generate a schedulable label that does not yet exist in this schedule."""
+        while True:
+            self._label_counter += 1
+            label = f"{self._label_prefix}{self._label_counter}"
+            if label not in self.schedulables:
+                return label
+
     def __getstate__(self) -> dict[str, Any]:
         return self.data
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.data = state
+        self._reset_label_generator()
 
 
 class Schedulable(JSONSchemaValMixin, UserDict):
@@ -738,12 +815,15 @@ class Schedulable(JSONSchemaValMixin, UserDict):
     def __init__(self, name: str, operation_repr: str) -> None:
         super().__init__()
 
-        self["name"] = name
-        self["operation_repr"] = operation_repr
-        self["timing_constraints"] = []
-
-        # the next lines are to prevent breaking the existing API
-        self["label"] = name
+        self.data.update(
+            {
+                "name": name,
+                "operation_repr": operation_repr,
+                "timing_constraints": [],
+                # the "label" key is to prevent breaking the existing API
+                "label": name,
+            }
+        )
 
     def add_timing_constraint(
         self,
@@ -798,7 +878,25 @@ class Schedulable(JSONSchemaValMixin, UserDict):
         self["timing_constraints"].append(timing_constr)
 
     def __str__(self) -> str:
-        return str(self["name"])
+        return str(self.data["name"])
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Schedulable:
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        # Timing constraints only hold numbers, strings and None (see
+        # add_timing_constraint), so copying the dicts is sufficient and much
+        # cheaper than a generic deepcopy. The same holds for the other immutable
+        # values, like the name and the absolute time.
+        data = {}
+        for key, value in self.data.items():
+            if key == "timing_constraints":
+                data[key] = [dict(constraint) for constraint in value]
+            elif isinstance(value, (str, int, float, type(None))):
+                data[key] = value
+            else:
+                data[key] = deepcopy(value, memo)
+        new.data = data
+        return new
 
     def __getstate__(self) -> dict[str, Any]:
         return {"deserialization_type": self.__class__.__name__, "data": self.data}
@@ -893,12 +991,7 @@ class CompiledSchedule(ScheduleBase):
         schedule. Not all back ends support this feature.
         """
         styled_hardware_timing_table = self._hardware_timing_table.style.format(
-            {
-                "abs_time": lambda val: f"{val*1e9:,.1f} ns",
-                "duration": lambda val: f"{val*1e9:,.1f} ns",
-                "clock_cycle_start": lambda val: f"{val:,.1f}",
-                "sample_start": lambda val: f"{val:,.1f}",
-            }
+            _HARDWARE_TIMING_TABLE_FORMATTERS
         )
 
         return styled_hardware_timing_table
@@ -941,11 +1034,15 @@ class AcquisitionMetadata:
     """How many times the acquisition was repeated on this specific sequencer."""
 
     def __getstate__(self) -> dict[str, Any]:
-        data = dataclasses.asdict(self)
+        # A shallow dict, dataclasses.asdict would deepcopy the acq_indices.
+        data = {
+            field.name: getattr(self, field.name) for field in dataclasses.fields(self)
+        }
         return {"deserialization_type": self.__class__.__name__, "data": data}
 
     def __setstate__(self, state: dict[str, Any]) -> dict[str, Any]:
-        state["data"]["acq_indices"] = {
-            int(k): v for k, v in state["data"]["acq_indices"].items()
-        }
+        acq_indices = state["data"]["acq_indices"]
+        # JSON turns the integer keys into strings, pickle keeps them as is.
+        if acq_indices and not isinstance(next(iter(acq_indices)), int):
+            state["data"]["acq_indices"] = {int(k): v for k, v in acq_indices.items()}
         self.__init__(**state["data"])
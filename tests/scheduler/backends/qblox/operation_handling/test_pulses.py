@@ -13,6 +13,7 @@
 import pytest
 import numpy as np
 import re
+import sys
 
 from quantify_scheduler import waveforms, Schedule
 from quantify_scheduler.backends import SerialCompiler
@@ -34,6 +35,10 @@ from .empty_qasm_program import (  # pylint: disable=unused-import
 )
 
 
+def custom_waveform_for_test_generate_data(t, amp):
+    return np.full(len(t), amp)
+
+
 class TestGenericPulseStrategy:
     def test_constructor(self):
         pulses.GenericPulseStrategy(
@@ -51,6 +56,37 @@ class TestGenericPulseStrategy:
         # assert
         assert op_info == from_property
 
+    def test_generate_data_custom_function_redefined(self, monkeypatch):
+        # arrange
+        data = {
+            "wf_func": __name__ + ".custom_waveform_for_test_generate_data",
+            "duration": 24e-9,
+            "amp": 0.5,
+        }
+
+        def generate_data():
+            strategy = pulses.GenericPulseStrategy(
+                types.OpInfo(name="", data=dict(data), timing=0), io_mode="complex"
+            )
+            strategy.generate_data(wf_dict={})
+            return strategy
+
+        strategy_before = generate_data()
+
+        # act
+        monkeypatch.setattr(
+            sys.modules[__name__],
+            "custom_waveform_for_test_generate_data",
+            lambda t, amp: np.full(len(t), 1j * amp),
+        )
+        strategy_after = generate_data()
+
+        # assert
+        assert strategy_before._amplitude_path0 == 0.5
+        assert strategy_before._amplitude_path1 == 0
+        assert strategy_after._amplitude_path0 == 0
+        assert strategy_after._amplitude_path1 == 0.5
+
     @pytest.mark.parametrize(
         "wf_func, wf_func_path, wf_kwargs",
         [
@@ -90,7 +126,7 @@ class TestGenericPulseStrategy:
         normalized_data, amp_real, amp_imag = normalize_waveform_data(
             wf_func(t=t_test, **wf_kwargs)
         )
-        assert waveform0_data == normalized_data.real.tolist()
+        np.testing.assert_array_equal(waveform0_data, normalized_data.real)
         assert strategy._amplitude_path0 == amp_real
         assert strategy._amplitude_path1 == amp_imag
         assert strategy._waveform_index0 == 0
@@ -129,13 +165,52 @@ class TestGenericPulseStrategy:
         normalized_data, amp_real, amp_imag = normalize_waveform_data(
             waveforms.drag(t=t_test, **data)
         )
-        assert waveform0_data == normalized_data.real.tolist()
-        assert waveform1_data == normalized_data.imag.tolist()
+        np.testing.assert_array_equal(waveform0_data, normalized_data.real)
+        np.testing.assert_array_equal(waveform1_data, normalized_data.imag)
         assert strategy._amplitude_path0 == amp_real
         assert strategy._amplitude_path1 == amp_imag
         assert strategy._waveform_index0 == 0
         assert strategy._waveform_index1 == 1
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {
+                "wf_func": "quantify_scheduler.waveforms.drag",
+                "duration": 24e-9,
+                "G_amp": 0.1234,
+                "D_amp": 1,
+                "nr_sigma": 3,
+                "phase": 0,
+            },
+            {
+                "wf_func": "quantify_scheduler.waveforms.interpolated_complex_waveform",
+                "duration": 24e-9,
+                "samples": [0.1 + 0.2j, 0.3 - 0.1j],
+                "t_samples": [0, 24e-9],
+            },
+        ],
+    )
+    def test_generate_data_repeated_pulse(self, data):
+        # arrange
+        wf_dicts = [{}, {}]
+        strategies = [
+            pulses.GenericPulseStrategy(
+                types.OpInfo(name="", data=dict(data), timing=timing),
+                io_mode="complex",
+            )
+            for timing in (0, 1e-6)
+        ]
+
+        # act
+        for strategy, wf_dict in zip(strategies, wf_dicts):
+            strategy.generate_data(wf_dict=wf_dict)
+
+        # assert
+        assert wf_dicts[0] == wf_dicts[1]
+        assert strategies[0]._amplitude_path0 == strategies[1]._amplitude_path0
+        assert strategies[0]._amplitude_path1 == strategies[1]._amplitude_path1
+
     @pytest.mark.parametrize(
         "wf_func, wf_func_path, wf_kwargs",
         [
@@ -175,7 +250,7 @@ class TestGenericPulseStrategy:
         normalized_data, amp_real, amp_imag = normalize_waveform_data(
             wf_func(t=t_test, **wf_kwargs)
         )
-        assert waveform0_data == normalized_data.real.tolist()
+        np.testing.assert_array_equal(waveform0_data, normalized_data.real)
         assert strategy._amplitude_path0 == amp_imag
         assert strategy._amplitude_path1 == amp_real
         assert strategy._waveform_index0 == None
@@ -282,10 +357,8 @@ class TestStitchedSquarePulseStrategy:
         waveform0_data = waveforms_generated[0]["data"]
         waveform1_data = waveforms_generated[1]["data"]
 
-        answer_path0 = np.ones(num_samples).tolist()
-        answer_path1 = np.zeros(num_samples).tolist()
-        assert waveform0_data == answer_path0
-        assert waveform1_data == answer_path1
+        np.testing.assert_array_equal(waveform0_data, np.ones(num_samples))
+        np.testing.assert_array_equal(waveform1_data, np.zeros(num_samples))
 
     @pytest.mark.filterwarnings("ignore::FutureWarning")
     @pytest.mark.parametrize(
@@ -314,8 +387,7 @@ class TestStitchedSquarePulseStrategy:
         waveforms_generated = list(wf_dict.values())
         waveform0_data = waveforms_generated[0]["data"]
 
-        answer_path0 = np.ones(num_samples).tolist()
-        assert waveform0_data == answer_path0
+        np.testing.assert_array_equal(waveform0_data, np.ones(num_samples))
         assert len(waveforms_generated) == 1
 
     @pytest.mark.filterwarnings("ignore::FutureWarning")
@@ -424,6 +424,26 @@ def test_generate_waveform_data():
     assert np.allclose(gen_data, verification_data)
 
 
+def function_for_test_generate_waveform_data_in_place(t):
+    t -= t[0]
+    t *= 2
+    return t
+
+
+def test_generate_waveform_data_custom_function_modifies_time_axis():
+    data_dict = {
+        "wf_func": __name__ + ".function_for_test_generate_waveform_data_in_place",
+        "duration": 1e-8,
+    }
+    gen_data = generate_waveform_data(data_dict, sampling_rate=1e9)
+    assert np.array_equal(gen_data, 2 * np.arange(10) / 1e9)
+    assert gen_data.flags.writeable
+
+    # The time axis passed to the next waveform was not modified by the first call.
+    gen_data = generate_waveform_data(data_dict, sampling_rate=1e9)
+    assert np.array_equal(gen_data, 2 * np.arange(10) / 1e9)
+
+
 @pytest.mark.parametrize(
     "sampling_rate, duration, sample_size",
     [
@@ -84,6 +84,29 @@ def test_get_waveform(
     assert args[2] == pulse_info_mock
 
 
+@pytest.mark.parametrize(
+    "duration,sampling_rate,expected_size",
+    [
+        (1.6e-08, 2.4e9, 39),
+        (10.5e-9, 1e9, 11),
+        (1e-8 * 3, 1e9, 30),
+        (0.1e-9 * 150, 1e9, 15),
+    ],
+)
+def test_get_waveform_number_of_samples(
+    duration: float, sampling_rate: float, expected_size: int
+) -> None:
+    pulse_info = {
+        "wf_func": "quantify_scheduler.waveforms.square",
+        "amp": 1,
+        "duration": duration,
+    }
+
+    waveform = get_waveform(pulse_info, sampling_rate)
+
+    assert len(waveform) == expected_size
+
+
 def test_get_waveform_by_pulseid(
     schedule_with_pulse_info: Schedule,
 ) -> None:
@@ -343,6 +366,21 @@ def test_modulate_waveform(frequency, t0, points) -> None:
     assert np.allclose(waveform.imag, expected_imag)
 
 
+def test_modulate_waveform_broadcasts_envelope() -> None:
+    envelope = np.array([1.0, 0.5j, -1.0])
+
+    # A scalar time is broadcast to the shape of the envelope.
+    waveform = modulate_waveform(0.5e-9, envelope, 1e8)
+    expected = envelope * np.exp(1j * 2 * np.pi * 1e8 * 0.5e-9)
+    assert waveform.shape == (3,)
+    assert np.allclose(waveform, expected)
+
+    # A scalar envelope is broadcast to the shape of t.
+    t = np.linspace(0, 1e-8, 3)
+    waveform = modulate_waveform(t, 0.5, 1e8)
+    assert np.allclose(waveform, 0.5 * np.exp(1j * 2 * np.pi * 1e8 * t))
+
+
 @pytest.mark.parametrize(
     "frequency,t0,points",
     [(10e6, 50e-9, 1000), (-10e6, 0.0, 1000), (0.0, -10e-9, 2), (10e6, -10e-9, 1)],
@@ -416,6 +454,12 @@ def test_area_pulses_long_pulse() -> None:
     TestCase().assertAlmostEqual(area, 1e6)
 
 
+def test_area_pulses_long_ramp_pulse() -> None:
+    operation = RampPulse(amp=1, offset=0.5, duration=1e6, port="P")
+    area = area_pulses(operation.data["pulse_info"], sampling_rate=1e10)
+    TestCase().assertAlmostEqual(area, 1e6)
+
+
 def test_area_pulses_ramp_pulse_regression() -> None:
     operation = RampPulse(amp=0, offset=1, duration=10.5e-9, port="P")
     area = area_pulses(operation.data["pulse_info"], sampling_rate=1e9)
@@ -35,6 +35,16 @@ def test_str():
     assert eval(str(pulse)) == pulse  # pylint: disable=eval-used # nosec
 
 
+def test_init_does_not_share_pulse_info_list():
+    """Test that adding pulses does not modify the list passed to the constructor."""
+    square = SquarePulse(amp=0.2, duration=1e-6, port="q0:mw", clock="q0.01")
+    pulse_info = list(square["pulse_info"])
+    pulse = StitchedPulse(pulse_info=pulse_info)
+    pulse.add_pulse(RampPulse(amp=0.5, duration=28e-9, port="q0:mw", clock="q0.01"))
+    assert len(pulse_info) == 1
+    assert len(pulse["pulse_info"]) == 2
+
+
 def test_add_operation_wrong_clock():
     """Tests that adding operations with different clocks raises an error."""
     pulse = (
@@ -111,6 +121,46 @@ def test_must_add_pulse(wrong: Operation):
         builder.add_pulse(wrong)
 
 
+def test_overlapping_offsets_fails():
+    """Test that an error is raised if an offset overlaps with an existing one."""
+    builder = (
+        StitchedPulseBuilder(port="q0:mw", clock="q0.01")
+        .add_voltage_offset(
+            path_0=0.5, path_1=0.0, duration=1e-7, rel_time=2e-7, append=False
+        )
+        .add_voltage_offset(
+            path_0=0.2, path_1=0.0, duration=1e-7, rel_time=5e-7, append=False
+        )
+    )
+    with pytest.raises(RuntimeError):
+        builder.add_voltage_offset(
+            path_0=0.1, path_1=0.0, duration=3e-7, rel_time=0.0, append=False
+        )
+    with pytest.raises(RuntimeError):
+        builder.add_voltage_offset(
+            path_0=0.1, path_1=0.0, duration=1e-7, rel_time=4.5e-7, append=False
+        )
+    # Fits exactly in between the existing offsets
+    builder.add_voltage_offset(
+        path_0=0.1, path_1=0.0, duration=2e-7, rel_time=3e-7, append=False
+    )
+
+
+def test_add_pulse_does_not_modify_original():
+    """Test that adding a pulse to the builder leaves the original untouched."""
+    square = SquarePulse(amp=0.2, duration=1e-6, port="q0:mw", clock="q0.01")
+    ramp = RampPulse(amp=0.5, duration=28e-9, port="q0:mw")
+    original_ramp_info = dict(ramp["pulse_info"][0])
+    _ = (
+        StitchedPulseBuilder(port="q0:mw", clock="q0.01", t0=1e-6)
+        .add_pulse(square)
+        .add_pulse(ramp)
+        .build()
+    )
+    assert square["pulse_info"][0]["t0"] == 0
+    assert ramp["pulse_info"][0] == original_ramp_info
+
+
 def test_add_operations():
     """Test that operations are correctly added to the StitchedPulse."""
     pulse = (
@@ -120,6 +170,7 @@ def test_add_operations():
         .add_voltage_offset(path_0=0.5, path_1=0.0, duration=1e-7)
         .build()
     )
+    assert pulse.duration == pytest.approx(1.128e-6)
     assert len(pulse.data["pulse_info"]) == 4
     assert pulse.data["pulse_info"][0] == {
         "amp": 0.2,
@@ -161,6 +212,30 @@ def test_add_operations():
     }
 
 
+def test_build_multiple_times():
+    """Test that building repeatedly gives the same result until the builder
+    changes."""
+    builder = (
+        StitchedPulseBuilder(port="q0:mw", clock="q0.01", t0=1e-6)
+        .add_pulse(SquarePulse(amp=0.2, duration=1e-6, port="q0:mw", clock="q0.01"))
+        .add_voltage_offset(path_0=0.5, path_1=0.0, duration=1e-7)
+    )
+    pulse_a = builder.build()
+    pulse_b = builder.build()
+    assert pulse_a == pulse_b
+    assert pulse_a["pulse_info"][0] is not pulse_b["pulse_info"][0]
+    assert pulse_a["pulse_info"][-1] is not pulse_b["pulse_info"][-1]
+    # Building again does not shift the pulses of the builder or of earlier results.
+    assert pulse_a["pulse_info"][0]["t0"] == pytest.approx(1e-6)
+    assert builder.operation_end == pytest.approx(1.1e-6)
+
+    builder.add_voltage_offset(path_0=0.2, path_1=0.0)
+    pulse_c = builder.build()
+    assert len(pulse_c["pulse_info"]) == len(pulse_a["pulse_info"]) + 1
+    assert pulse_c["pulse_info"][0]["t0"] == pytest.approx(1e-6)
+    assert pulse_c["pulse_info"][-1]["t0"] == pytest.approx(1.1e-6)
+
+
 def test_add_operations_insert_timing():
     """Test that operations can be inserted at a specific time."""
     pulse = (
@@ -213,6 +288,20 @@ def test_add_operations_insert_timing():
     }
 
 
+def test_no_reset_of_offset_equal_to_background():
+    """Test that no reset is added for an offset that equals the background."""
+    pulse = (
+        StitchedPulseBuilder(port="q0:mw", clock="q0.01")
+        .add_pulse(SquarePulse(amp=0.2, duration=1e-6, port="q0:mw", clock="q0.01"))
+        .add_voltage_offset(
+            path_0=0.0, path_1=0.0, duration=1e-7, rel_time=5e-7, append=False
+        )
+        .build()
+    )
+    assert len(pulse.data["pulse_info"]) == 2
+    assert pulse.data["pulse_info"][1]["t0"] == 5e-7
+
+
 def test_convert_to_numerical():
     pulse = long_ramp_pulse(
         amp=0.5, duration=1e-4, port="some_port", clock="some_clock", offset=-0.25
@@ -47,13 +47,16 @@ def test_acquisition_staircase_ops(gen_acquisition_staircase_sched):
 
 def test_acquisition_staircase_amps(gen_acquisition_staircase_sched):
     sched, sched_kwargs = gen_acquisition_staircase_sched
-    amps = []
-    for operation in sched.operations.values():
-        if "amp" in str(operation):
-            amp = operation.data["pulse_info"][0]["amp"]
-            amps.append(amp)
+    amps = np.fromiter(
+        (
+            operation.data["pulse_info"][0]["amp"]
+            for operation in sched.operations.values()
+            if "amp" in str(operation)
+        ),
+        dtype=float,
+    )
 
-    assert_array_equal(np.array(amps), sched_kwargs["readout_pulse_amps"])
+    assert_array_equal(amps, sched_kwargs["readout_pulse_amps"])
 
 
 def test_acq_staircase_comp_transmon(
@@ -115,13 +118,16 @@ def test_awg_staircase_sched(gen_awg_staircase_sched):
     # number of unique operations
     assert len(sched.operations) == 2 * len(sched_kwargs["pulse_amps"]) + 1
 
-    amps = []
-    for operation in sched.operations.values():
-        if "amp" in str(operation):
-            amp = operation.data["pulse_info"][0]["amp"]
-            amps.append(amp)
+    amps = np.fromiter(
+        (
+            operation.data["pulse_info"][0]["amp"]
+            for operation in sched.operations.values()
+            if "amp" in str(operation)
+        ),
+        dtype=float,
+    )
 
-    assert_array_equal(np.array(amps), sched_kwargs["pulse_amps"])
+    assert_array_equal(amps, sched_kwargs["pulse_amps"])
 
 
 def test_awg_staircase_comp_transmon(
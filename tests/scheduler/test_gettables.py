@@ -20,6 +20,7 @@ from qcodes.instrument.parameter import ManualParameter
 from xarray import DataArray, Dataset
 
 from quantify_scheduler.backends import SerialCompiler
+from quantify_scheduler import gettables as gettables_module
 from quantify_scheduler.enums import BinMode
 from quantify_scheduler.gettables import ScheduleGettable
 from quantify_scheduler.gettables_profiled import ProfiledScheduleGettable
@@ -154,6 +155,51 @@ def test_schedule_gettable_iterative_heterodyne_spec(mock_setup_basic_transmon,
     np.testing.assert_array_equal(dset.y1, np.angle(exp_data, deg=True))
 
 
+def test_schedule_gettable_acq_metadata_extracted_once(
+    mock_setup_basic_transmon, mocker
+):
+    quantum_device = mock_setup_basic_transmon["quantum_device"]
+    qubit = quantum_device.get_element("q0")
+
+    schedule_kwargs = {
+        "pulse_amp": qubit.measure.pulse_amp(),
+        "pulse_duration": qubit.measure.pulse_duration(),
+        "frequency": 5e9,
+        "acquisition_delay": qubit.measure.acq_delay(),
+        "integration_time": qubit.measure.integration_time(),
+        "port": qubit.ports.readout(),
+        "clock": qubit.name + ".ro",
+        "init_duration": qubit.reset.duration(),
+    }
+    data = np.exp(1j * np.deg2rad(45)).astype(np.complex64)
+    mocker.patch.object(
+        mock_setup_basic_transmon["instrument_coordinator"],
+        "retrieve_acquisition",
+        return_value=Dataset({0: (["acq_index_0"], data.reshape((1,)))}),
+    )
+    extract_spy = mocker.spy(
+        gettables_module, "extract_acquisition_metadata_from_schedule"
+    )
+
+    spec_gettable = ScheduleGettable(
+        quantum_device=quantum_device,
+        schedule_function=heterodyne_spec_sched,
+        schedule_kwargs=schedule_kwargs,
+        real_imag=False,
+        always_initialize=False,
+    )
+    first = spec_gettable.get()
+    second = spec_gettable.get()
+
+    assert extract_spy.call_count == 1
+    np.testing.assert_array_equal(first, second)
+
+    # Recompiling the schedule extracts the metadata of the new compiled schedule.
+    spec_gettable.initialize()
+    spec_gettable.get()
+    assert extract_spy.call_count == 2
+
+
 # test a batched case
 def test_schedule_gettable_batched_allxy(
     mock_setup_basic_transmon_with_standard_params, mocker
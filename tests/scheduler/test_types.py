@@ -5,6 +5,7 @@
 # pylint: disable=eval-used
 import copy
 import json
+import pickle
 
 import numpy as np
 import pandas as pd
@@ -12,6 +13,7 @@ import pytest
 
 from quantify_scheduler import enums, json_utils, Operation
 from quantify_scheduler.backends import SerialCompiler
+from quantify_scheduler.compilation import determine_absolute_timing
 from quantify_scheduler.json_utils import ScheduleJSONDecoder
 from quantify_scheduler.operations.acquisition_library import SSBIntegrationComplex
 from quantify_scheduler.operations.gate_library import (
@@ -133,6 +135,112 @@ def test_schedule_add_timing_constraints():
     assert Schedule.is_valid(sched)
 
 
+def test_schedule_add_generates_unique_labels():
+    sched = Schedule("labels")
+    first = sched.add(X("q0"))
+    sched.add(X("q0"), label="s1")
+    sched.add(X("q0"), label="1")
+    sched.add(X("q0"))
+
+    assert len(set(sched.schedulables)) == 4
+
+    sched_copy = Schedule.from_json(sched.to_json())
+    new_label = sched_copy.add(X("q0"))["label"]
+    assert new_label not in sched.schedulables
+
+    # A generated label of another schedule does not refer to a schedulable here.
+    other_sched = Schedule("other")
+    other_sched.add(X("q1"))
+    with pytest.raises(ValueError, match="does not exists"):
+        other_sched.add(X("q1"), ref_op=str(first))
+
+
+def test_schedule_add_interns_equal_operations():
+    sched = Schedule("interning")
+    first = Rxy(theta=90, phi=0, qubit="q0")
+    second = Rxy(theta=90, phi=0, qubit="q0")
+    sched.add(first)
+    sched.add(second)
+
+    assert len(sched.operations) == 1
+    assert sched.operations[second.hash] is first
+
+
+def test_schedulable_deepcopy():
+    sched = Schedule("deepcopy")
+    ref = sched.add(X("q0"), label="ref")
+    schedulable = sched.add(X("q1"), ref_op=ref, rel_time=20e-9)
+
+    schedulable_copy = copy.deepcopy(schedulable)
+
+    assert isinstance(schedulable_copy, Schedulable)
+    assert schedulable_copy == schedulable
+    assert schedulable_copy.data is not schedulable.data
+    assert (
+        schedulable_copy["timing_constraints"] is not schedulable["timing_constraints"]
+    )
+    assert (
+        schedulable_copy["timing_constraints"][0]
+        is not schedulable["timing_constraints"][0]
+    )
+
+
+def test_compiled_schedule_is_independent_of_schedule():
+    sched = Schedule("independent")
+    schedulable = sched.add(X("q0"))
+    determine_absolute_timing(sched)
+
+    compiled_sched = CompiledSchedule(sched)
+    schedulable["abs_time"] = 1.0
+    schedulable["timing_constraints"][0]["rel_time"] = 1.0
+    sched.add(X("q1"))
+
+    compiled_schedulable = compiled_sched.schedulables[schedulable["name"]]
+    assert compiled_schedulable["abs_time"] == 0
+    assert compiled_schedulable["timing_constraints"][0]["rel_time"] == 0
+    assert len(compiled_sched.schedulables) == 1
+
+
+def test_get_schedule_duration():
+    sched = Schedule("duration", repetitions=3)
+    pulse = SquarePulse(amp=0.1, duration=100e-9, port="q0:mw", clock="q0.01")
+    sched.add(pulse)
+    sched.add(pulse, rel_time=20e-9)
+    sched.add(
+        SSBIntegrationComplex(port="q0:res", clock="q0.ro", duration=1e-6),
+        ref_pt="start",
+    )
+    determine_absolute_timing(sched)
+
+    assert sched.get_schedule_duration() == pytest.approx(3 * 1.12e-6)
+
+
+def test_timing_table_reused_operation():
+    sched = Schedule("timing table")
+    pulse = SquarePulse(amp=0.1, duration=100e-9, port="q0:mw", clock="q0.01")
+    sched.add(pulse)
+    sched.add(
+        SSBIntegrationComplex(port="q0:res", clock="q0.ro", duration=1e-6),
+        ref_pt="start",
+    )
+    sched.add(pulse, rel_time=20e-9)
+    determine_absolute_timing(sched)
+
+    timing_table = sched.timing_table.data
+
+    assert list(timing_table.abs_time) == pytest.approx([0, 0, 1.02e-6])
+    assert list(timing_table.is_acquisition) == [False, True, False]
+    assert timing_table.operation[0] == timing_table.operation[2] == str(pulse)
+
+
+def test_timing_table_requires_absolute_timing():
+    sched = Schedule("timing table")
+    sched.add(X("q0"))
+
+    with pytest.raises(ValueError, match="Absolute time has not been determined"):
+        _ = sched.timing_table
+
+
 def test_gates_valid():
     init_all = Reset("q0", "q1")  # instantiates
     rxy_operation = Rxy(theta=124, phi=23.9, qubit="q5")
@@ -477,3 +585,8 @@ def test_acquisition_metadata():
     assert metadata_copy == metadata
     assert isinstance(metadata_copy.bin_mode, enums.BinMode)
     assert isinstance(metadata_copy.acq_return_type, type)
+
+    # Test that pickling keeps the integer acq_indices keys
+    metadata_copy = pickle.loads(pickle.dumps(metadata))
+    assert metadata_copy == metadata
+    assert list(metadata_copy.acq_indices) == [0]
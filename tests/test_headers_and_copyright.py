@@ -4,11 +4,56 @@ import datetime
 import os
 import pprint
 import re
+import subprocess
 from pathlib import Path
 
 import pytest
 
 
+def _is_skipped_dir(dir_name: str, skipdirs: set) -> bool:
+    return any(dir_name.startswith(name) for name in skipdirs)
+
+
+def _python_files(root_path: Path, skipdirs: set) -> list:
+    """
+    Python files in the repository, outside of the skipped directories.
+
+    Uses ``git ls-files`` when possible, so that untracked files (virtual
+    environments, build artifacts, etc.) are never visited, and falls back to
+    walking the directory tree otherwise.
+    """
+    try:
+        tracked_files = subprocess.run(
+            ["git", "-C", str(root_path), "ls-files", "--", "*.py"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.splitlines()
+    except (OSError, subprocess.CalledProcessError):
+        tracked_files = []
+
+    if tracked_files:
+        return [
+            root_path / file_name
+            for file_name in tracked_files
+            if not any(
+                _is_skipped_dir(dir_name, skipdirs)
+                for dir_name in Path(file_name).parent.parts
+            )
+        ]
+
+    python_files = []
+    for root, dirs, files in os.walk(root_path):
+        # skip hidden folders, etc, without descending into them
+        dirs[:] = [
+            dir_name for dir_name in dirs if not _is_skipped_dir(dir_name, skipdirs)
+        ]
+        python_files.extend(
+            Path(root) / file_name for file_name in files if file_name[-3:] == ".py"
+        )
+    return python_files
+
+
 def test_header() -> None:
     skipfiles = {
         "__init__.py",
@@ -24,21 +69,17 @@ def test_header() -> None:
         "# Repository: https://gitlab.com/quantify-os/quantify-scheduler",
         "# Licensed according to the LICENCE file on the main branch",
     ]
-    for root, _, files in os.walk(quantify_scheduler_path):
-        # skip hidden folders, etc
-        if any(part.startswith(name) for part in Path(root).parts for name in skipdirs):
+    for file_path in _python_files(quantify_scheduler_path, skipdirs):
+        if file_path.name in skipfiles:
             continue
-        for file_name in files:
-            if file_name[-3:] == ".py" and file_name not in skipfiles:
-                file_path = Path(root) / file_name
-                with open(file_path, "r") as file:
-                    lines_iter = (line.strip() for line in file)
-                    line_matches = [
-                        expected_line == line
-                        for expected_line, line in zip(header_lines, lines_iter)
-                    ]
-                    if not all(line_matches):
-                        failures.append(str(file_path))
+        with open(file_path, "r") as file:
+            lines_iter = (line.strip() for line in file)
+            line_matches = [
+                expected_line == line
+                for expected_line, line in zip(header_lines, lines_iter)
+            ]
+            if not all(line_matches):
+                failures.append(str(file_path))
     if failures:
         pytest.fail("Bad headers:\n{}".format(pprint.pformat(failures)))
 
@@ -49,11 +90,11 @@ def test_docs_copyright() -> None:
     copyright_found = False
     current_year = str(datetime.datetime.now().year)
     cr_match = 'copyright = "2020-20.*Qblox & Orange Quantum Systems'
+    cr_pattern = re.compile(cr_match)
     with open(conf_file, "r") as file:
-        for line in file.readlines():
-            if re.match(cr_match, line):
-                if current_year in line:
-                    copyright_found = True
+        for line in file:
+            if cr_pattern.match(line):
+                copyright_found = current_year in line
                 break
 
     assert copyright_found, (